@@ -5,11 +5,23 @@ This script generates synthetic audio files with known content
 for testing the transcription system end-to-end.
 """
 
+import asyncio
+import math
+import mmap
+import struct
+import traceback
 import numpy as np
 import soundfile as sf
 from pathlib import Path
+from typing import Optional
 import logging
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -19,8 +31,85 @@ def generate_sine_wave_audio(frequency: float, duration: float, sample_rate: int
     audio = np.sin(2 * np.pi * frequency * t) * 0.3  # Low amplitude
     return audio.astype(np.float32)
 
-def generate_speech_like_audio(duration: float, sample_rate: int = 16000) -> np.ndarray:
-    """Generate speech-like audio using multiple frequency components."""
+def _synth_speech(out: np.ndarray, sample_rate: int, noise: np.ndarray,
+                  gain: float, pcm_scale: float) -> None:
+    """Write speech-like samples into out in a single pass.
+
+    Same signal as the NumPy path below (three modulated formants, noise and
+    a pause envelope) but computed per sample, so no intermediate arrays are
+    allocated. Each formant keeps a running phase that advances by
+    2*pi*f(t)/sample_rate per sample, so the state is three scalars.
+    Samples are multiplied by gain; with a non-zero pcm_scale they are also
+    scaled and clipped for an integer PCM out array.
+    """
+    n = out.shape[0]
+    segment_length = sample_rate  # 1 second segments
+    pause_end = int(segment_length * 1.5)
+    two_pi = 2.0 * math.pi
+    inv_sr = 1.0 / sample_rate
+    phi1 = phi2 = phi3 = 0.0
+    for i in range(n):
+        t = i * inv_sr
+        f1 = 100.0 + 50.0 * math.sin(two_pi * 0.5 * t)
+        f2 = 800.0 + 200.0 * math.sin(two_pi * 0.3 * t)
+        f3 = 2400.0 + 400.0 * math.sin(two_pi * 0.1 * t)
+        sample = (math.sin(phi1) * 0.3 +
+                  math.sin(phi2) * 0.2 +
+                  math.sin(phi3) * 0.1 + noise[i])
+        phi1 += two_pi * f1 * inv_sr
+        phi2 += two_pi * f2 * inv_sr
+        phi3 += two_pi * f3 * inv_sr
+        position = i % (2 * segment_length)
+        if segment_length <= position < pause_end:
+            sample *= 0.1
+        sample *= gain
+        if pcm_scale != 0.0:
+            sample = min(max(sample * pcm_scale, -32768.0), 32767.0)
+        out[i] = sample
+
+PCM16_SCALE = 32767.0
+WAV_HEADER_SIZE = 44
+
+if NUMBA_AVAILABLE:
+    # fastmath plus the numpy error model (no ZeroDivisionError checks) lets
+    # LLVM vectorize math.sin through SVML when numba finds the icc_rt library.
+    # nogil lets the per-file worker threads run the kernel simultaneously.
+    _synth_kernel = njit(nogil=True, fastmath=True, error_model="numpy",
+                         cache=True)(_synth_speech)
+
+    # Compile (or load from the on-disk cache) now so the first real file
+    # does not pay JIT time; fall back to NumPy if compilation fails.
+    try:
+        for dtype in (np.float32, np.int16):
+            _synth_kernel(np.empty(1, dtype=dtype), 16000, np.zeros(1, dtype=np.float32), 1.0,
+                          PCM16_SCALE if dtype is np.int16 else 0.0)
+    except Exception as e:
+        logger.warning(f"Numba synth kernel unavailable, using NumPy: {e}")
+        NUMBA_AVAILABLE = False
+
+def generate_speech_like_audio(duration: float, sample_rate: int = 16000,
+                               out: Optional[np.ndarray] = None,
+                               rng: Optional[np.random.Generator] = None,
+                               gain: float = 1.0) -> np.ndarray:
+    """Generate speech-like audio using multiple frequency components.
+
+    If out is given, samples are written into it (it must hold
+    int(sample_rate * duration) float32 or int16 values; int16 receives
+    16-bit PCM) and it is returned. Noise is drawn from rng when given,
+    otherwise from a fresh generator. Samples are scaled by gain.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    if NUMBA_AVAILABLE:
+        num_samples = int(sample_rate * duration)
+        noise = rng.standard_normal(num_samples, dtype=np.float32) * np.float32(0.05)
+        if out is None:
+            out = np.empty(num_samples, dtype=np.float32)
+        pcm_scale = PCM16_SCALE if out.dtype == np.int16 else 0.0
+        _synth_kernel(out, sample_rate, noise, gain, pcm_scale)
+        return out
+
     t = np.linspace(0, duration, int(sample_rate * duration), False)
 
     # Base frequencies typical for human speech
@@ -28,13 +117,16 @@ def generate_speech_like_audio(duration: float, sample_rate: int = 16000) -> np.
     f2 = 800 + 200 * np.sin(2 * np.pi * 0.3 * t)  # First formant
     f3 = 2400 + 400 * np.sin(2 * np.pi * 0.1 * t)  # Second formant
 
-    # Generate speech-like signal
-    signal = (np.sin(2 * np.pi * f1 * t) * 0.3 +
-              np.sin(2 * np.pi * f2 * t) * 0.2 +
-              np.sin(2 * np.pi * f3 * t) * 0.1)
+    # Generate speech-like signal; each phase is the running sum of 2*pi*f/sr
+    def phase(f):
+        return 2 * np.pi * (np.cumsum(f) - f) / sample_rate
+
+    signal = (np.sin(phase(f1)) * 0.3 +
+              np.sin(phase(f2)) * 0.2 +
+              np.sin(phase(f3)) * 0.1)
 
     # Add some noise for realism
-    noise = np.random.normal(0, 0.05, len(signal))
+    noise = rng.normal(0, 0.05, len(signal))
     signal = signal + noise
 
     # Apply envelope to create speech-like segments
@@ -47,61 +139,111 @@ def generate_speech_like_audio(duration: float, sample_rate: int = 16000) -> np.
         pause_end = min(i + int(segment_length * 1.5), len(signal))
         envelope[pause_start:pause_end] *= 0.1
 
-    return (signal * envelope).astype(np.float32)
+    audio = signal * envelope * gain
+    if out is None:
+        return audio.astype(np.float32)
+    out[:] = to_pcm16(audio) if out.dtype == np.int16 else audio
+    return out
 
-def create_test_audio_files():
-    """Create various test audio files."""
-    test_dir = Path("test_audio")
-    test_dir.mkdir(exist_ok=True)
+def to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Quantize float audio in [-1, 1] to 16-bit PCM samples."""
+    return np.clip(audio * 32767.0, -32768, 32767).astype(np.int16)
 
-    sample_rate = 16000  # WhisperX prefers 16kHz
+def _wav_header(num_samples: int, sample_rate: int) -> bytes:
+    """Build the 44-byte header of a mono 16-bit PCM WAV file."""
+    data_size = num_samples * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", data_size,
+    )
+
+def synthesize_wav(path: Path, sample_rate: int, segments: list,
+                   rng: Optional[np.random.Generator] = None) -> Path:
+    """Synthesize speech-like segments straight into a memory-mapped WAV file.
 
-    test_files = []
+    segments is a list of (duration, gain) pairs written back to back. The
+    file is sized up front and the PCM region is filled in place, so no
+    separate sample buffer is built and copied into the writer.
+    """
+    counts = [int(sample_rate * duration) for duration, _ in segments]
+    num_samples = sum(counts)
+    try:
+        with open(path, "w+b") as f:
+            f.truncate(WAV_HEADER_SIZE + num_samples * 2)
+            with mmap.mmap(f.fileno(), 0) as mm:
+                mm[:WAV_HEADER_SIZE] = _wav_header(num_samples, sample_rate)
+                pcm = np.frombuffer(mm, dtype=np.int16, offset=WAV_HEADER_SIZE, count=num_samples)
+                try:
+                    offset = 0
+                    for (duration, gain), count in zip(segments, counts):
+                        generate_speech_like_audio(duration, sample_rate, out=pcm[offset:offset + count],
+                                                   rng=rng, gain=gain)
+                        offset += count
+                except BaseException as e:
+                    # Frames in the traceback still hold slices of pcm
+                    traceback.clear_frames(e.__traceback__)
+                    raise
+                finally:
+                    # Release the buffer export before the map closes, or
+                    # closing it raises BufferError and masks any error above
+                    del pcm
+                mm.flush()
+    except BaseException:
+        # Never leave a sized but half-synthesized WAV behind
+        path.unlink(missing_ok=True)
+        raise
+    return path
 
-    # 1. Short speech-like audio (5 seconds)
+def _make_short(test_dir: Path, sample_rate: int, rng: np.random.Generator) -> Path:
+    """1. Short speech-like audio (5 seconds)."""
     logger.info("Creating short speech-like audio...")
-    short_audio = generate_speech_like_audio(5.0, sample_rate)
-    short_file = test_dir / "short_speech.wav"
-    sf.write(short_file, short_audio, sample_rate)
-    test_files.append(short_file)
+    return synthesize_wav(test_dir / "short_speech.wav", sample_rate, [(5.0, 1.0)], rng)
 
-    # 2. Medium speech-like audio (15 seconds)
+def _make_medium(test_dir: Path, sample_rate: int, rng: np.random.Generator) -> Path:
+    """2. Medium speech-like audio (15 seconds)."""
     logger.info("Creating medium speech-like audio...")
-    medium_audio = generate_speech_like_audio(15.0, sample_rate)
-    medium_file = test_dir / "medium_speech.wav"
-    sf.write(medium_file, medium_audio, sample_rate)
-    test_files.append(medium_file)
+    return synthesize_wav(test_dir / "medium_speech.wav", sample_rate, [(15.0, 1.0)], rng)
 
-    # 3. Multi-speaker simulation (10 seconds with frequency changes)
+def _make_multi_speaker(test_dir: Path, sample_rate: int, rng: np.random.Generator) -> Path:
+    """3. Multi-speaker simulation (10 seconds with frequency changes)."""
     logger.info("Creating multi-speaker simulation...")
-    duration = 10.0
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    # Speaker 1 for the first 5 seconds, speaker 2 slightly louder for the next 5
+    return synthesize_wav(test_dir / "multi_speaker.wav", sample_rate, [(5.0, 1.0), (5.0, 1.2)], rng)
 
-    # Speaker 1: Lower frequency (first 5 seconds)
-    speaker1 = generate_speech_like_audio(5.0, sample_rate)
-    # Speaker 2: Higher frequency (next 5 seconds)
-    speaker2_audio = generate_speech_like_audio(5.0, sample_rate)
-    speaker2 = speaker2_audio * 1.2  # Slightly different amplitude
-
-    multi_speaker = np.concatenate([speaker1, speaker2])
-    multi_file = test_dir / "multi_speaker.wav"
-    sf.write(multi_file, multi_speaker, sample_rate)
-    test_files.append(multi_file)
-
-    # 4. Quiet audio for testing low volume
+def _make_quiet(test_dir: Path, sample_rate: int, rng: np.random.Generator) -> Path:
+    """4. Quiet audio for testing low volume."""
     logger.info("Creating quiet audio...")
-    quiet_audio = generate_speech_like_audio(8.0, sample_rate) * 0.1  # Very quiet
-    quiet_file = test_dir / "quiet_speech.wav"
-    sf.write(quiet_file, quiet_audio, sample_rate)
-    test_files.append(quiet_file)
+    return synthesize_wav(test_dir / "quiet_speech.wav", sample_rate, [(8.0, 0.1)], rng)
 
-    # 5. High quality audio (44.1kHz)
+def _make_high_quality(test_dir: Path, sample_rate: int, rng: np.random.Generator) -> Path:
+    """5. High quality audio (44.1kHz)."""
     logger.info("Creating high quality audio...")
     hq_sample_rate = 44100
-    hq_audio = generate_speech_like_audio(6.0, hq_sample_rate)
-    hq_file = test_dir / "high_quality_speech.wav"
-    sf.write(hq_file, hq_audio, hq_sample_rate)
-    test_files.append(hq_file)
+    return synthesize_wav(test_dir / "high_quality_speech.wav", hq_sample_rate, [(6.0, 1.0)], rng)
+
+async def create_test_audio_files_async(seed: Optional[int] = None):
+    """Create various test audio files, synthesizing them concurrently.
+
+    Each file gets its own child generator spawned from one seed, so the
+    worker threads never contend on NumPy's global RNG.
+    """
+    if NUMBA_AVAILABLE:
+        import numba
+        if not numba.config.USING_SVML:
+            logger.info("SVML not available to numba; install icc_rt for vectorized sin")
+    test_dir = Path("test_audio")
+    test_dir.mkdir(exist_ok=True)
+
+    sample_rate = 16000  # WhisperX prefers 16kHz
+
+    makers = [_make_short, _make_medium, _make_multi_speaker, _make_quiet, _make_high_quality]
+    rngs = np.random.default_rng(seed).spawn(len(makers))
+    test_files = list(await asyncio.gather(*(
+        asyncio.to_thread(make, test_dir, sample_rate, rng)
+        for make, rng in zip(makers, rngs)
+    )))
 
     # Create metadata file
     metadata = {
@@ -113,12 +255,13 @@ def create_test_audio_files():
     }
 
     for test_file in test_files:
+        info = sf.info(test_file)  # one header read per file
         file_info = {
             "filename": test_file.name,
             "path": str(test_file),
-            "duration": sf.info(test_file).duration,
-            "samplerate": sf.info(test_file).samplerate,
-            "channels": sf.info(test_file).channels,
+            "duration": info.duration,
+            "samplerate": info.samplerate,
+            "channels": info.channels,
             "size_bytes": test_file.stat().st_size
         }
         metadata["test_files"].append(file_info)
@@ -137,6 +280,10 @@ def create_test_audio_files():
 
     return test_files, metadata
 
+def create_test_audio_files(seed: Optional[int] = None):
+    """Create various test audio files."""
+    return asyncio.run(create_test_audio_files_async(seed))
+
 if __name__ == "__main__":
     try:
         test_files, metadata = create_test_audio_files()
@@ -3,6 +3,7 @@
 Test script to verify MCP server connectivity.
 """
 
+import argparse
 import asyncio
 import json
 import sys
@@ -12,16 +13,51 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-try:
-    from mcp import ClientSession, StdioServerParameters
-    from mcp.client.stdio import stdio_client
-except ImportError:
-    print("❌ MCP SDK not installed. Install with: pip install mcp")
-    sys.exit(1)
+def _field(obj, key, default=''):
+    """Read key from a tool object, or from a plain dict description."""
+    try:
+        return getattr(obj, key)
+    except AttributeError:
+        return obj.get(key, default) if isinstance(obj, dict) else default
+
+
+def print_tools(tools):
+    """Print the name and a short description of each tool."""
+    print(f"✅ Found {len(tools)} tools:")
+    print()
+
+    for i, tool in enumerate(tools, 1):
+        tool_name = _field(tool, 'name', 'Unknown')
+        tool_desc = _field(tool, 'description', 'No description') or 'No description'
+
+        print(f"   {i}. {tool_name}")
+        print(f"      {tool_desc[:80]}..." if len(tool_desc) > 80 else f"      {tool_desc}")
+        print()
+
+
+async def list_tools_in_process():
+    """List the FastMCP server's tools by importing it in this process.
+
+    This skips launching the server subprocess and the stdio JSON-RPC round
+    trip, so it only checks that the tools register, not that a client can
+    connect.
+    """
+    print("🔄 Importing FastMCP server in-process...")
+    from src.mcp_server.fastmcp_server import server
+
+    tools = await server.list_tools()
+    print_tools(tools)
 
 
 async def test_mcp_server():
     """Test the TranscribeMCP MCP server connection and tools."""
+    # Imported here so --help and --in-process do not pay for the client SDK
+    try:
+        from mcp import ClientSession, StdioServerParameters
+        from mcp.client.stdio import stdio_client
+    except ImportError:
+        print("❌ MCP SDK not installed. Install with: pip install mcp")
+        sys.exit(1)
 
     print("=" * 60)
     print("TranscribeMCP MCP Server Connection Test")
@@ -59,16 +95,7 @@ async def test_mcp_server():
                 else:
                     tools = tools_response
 
-                print(f"✅ Found {len(tools)} tools:")
-                print()
-
-                for i, tool in enumerate(tools, 1):
-                    tool_name = tool.name if hasattr(tool, 'name') else tool.get('name', 'Unknown')
-                    tool_desc = tool.description if hasattr(tool, 'description') else tool.get('description', 'No description')
-
-                    print(f"   {i}. {tool_name}")
-                    print(f"      {tool_desc[:80]}..." if len(tool_desc) > 80 else f"      {tool_desc}")
-                    print()
+                print_tools(tools)
 
                 print("=" * 60)
                 print("✅ MCP Server Test Completed Successfully")
@@ -93,4 +120,9 @@ async def test_mcp_server():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_mcp_server())
+    parser = argparse.ArgumentParser(description="Verify MCP server connectivity")
+    parser.add_argument("--in-process", action="store_true",
+                        help="only list tools by importing the server, without the stdio connection")
+    args = parser.parse_args()
+
+    asyncio.run(list_tools_in_process() if args.in_process else test_mcp_server())
@@ -8,14 +8,20 @@ across the codebase, excluding certain directories and handling special cases.
 BACKUP CREATED: backup-before-rename-20251001-054433
 """
 
+import mmap
 import os
 import re
+import shutil
 import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple, Union
 
 # Directories to exclude
-EXCLUDE_DIRS = {
+EXCLUDE_DIRS = frozenset({
     'transcribe_mcp_env',
     'transcribe_mcp_env',
     '.git',
@@ -27,7 +33,15 @@ EXCLUDE_DIRS = {
     '.venv',
     'venv',
     'tests/outputs',  # Test outputs - will be regenerated
-}
+})
+
+# Single-component exclusions, matched against each directory name the
+# walker meets below the project root (never against the root's ancestors)
+EXCLUDE_NAMES = frozenset(d for d in EXCLUDE_DIRS if '/' not in d)
+
+# Multi-component exclusions such as 'tests/outputs' cannot match a single
+# directory name; they are compared with the '/'-joined path from the root
+EXCLUDE_REL_PATHS = frozenset(d for d in EXCLUDE_DIRS if '/' in d)
 
 # File patterns to process
 INCLUDE_PATTERNS = {
@@ -43,6 +57,25 @@ INCLUDE_PATTERNS = {
     '*.ini',
 }
 
+# Every include pattern is '*.ext', so a suffix tuple for str.endswith suffices
+INCLUDE_SUFFIXES = tuple(sorted(p[1:] for p in INCLUDE_PATTERNS))
+
+# Case-insensitive screen for files that mention the project name
+SCREEN_RE = re.compile(rb'transcribe_mcp', re.IGNORECASE)
+
+# Files below this size are read and lowercased whole; larger ones are mmapped
+SMALL_FILE_BYTES = 64 * 1024
+
+# Above this many matched files the rename runs in a process pool
+POOL_MIN_FILES = 256
+
+# Files below this size get a substring pre-check before the regex pass
+QUICK_CHECK_BYTES = 4096
+
+# With --verbose the report is flushed to stdout every this many lines;
+# otherwise it is written once at the end
+PRINT_BATCH_LINES = 1024
+
 # Replacement mappings
 REPLACEMENTS = [
     # Exact matches (case-sensitive)
@@ -61,60 +94,176 @@ REPLACEMENTS = [
     ('TRANSCRIBE_MCP_', 'TRANSCRIBE_MCP_'),
 ]
 
-
-def should_process_file(file_path: Path) -> bool:
-    """Check if file should be processed."""
-    # Check if in excluded directory
-    for exclude_dir in EXCLUDE_DIRS:
-        if exclude_dir in file_path.parts:
-            return False
-
-    # Check if matches include pattern
-    for pattern in INCLUDE_PATTERNS:
-        if file_path.match(pattern):
-            return True
-
-    return False
-
-
-def find_files_to_process(root_dir: Path) -> List[Path]:
-    """Find all files that need processing."""
+# All replacements as one alternation over raw bytes, so files are never
+# decoded; longer keys come first so that at any position the longest key
+# wins (e.g. TRANSCRIBE_MCP_ over TRANSCRIBE_MCP)
+MAPPING_B = {old.encode('utf-8'): new.encode('utf-8') for old, new in REPLACEMENTS}
+PATTERN_B = re.compile(b'|'.join(re.escape(old) for old in sorted(MAPPING_B, key=len, reverse=True)))
+
+# Encoded key next to each replacement, for reporting counts in REPLACEMENTS order
+REPORT_KEYS = [(old.encode('utf-8'), old, new) for old, new in REPLACEMENTS]
+
+
+def screen_file(file_path: Union[str, Path],
+                max_size: Optional[int] = None) -> Tuple[bool, Optional[bytes]]:
+    """Check whether a file contains 'transcribe_mcp' in any letter case.
+
+    Empty files and files larger than max_size bytes are skipped without
+    being opened. Small files are checked with one read; larger ones are
+    memory-mapped and searched as raw bytes, so they are neither decoded
+    nor copied into a lowercased string.
+
+    Returns whether the file matched, plus its content when it was read
+    whole (small files only) so it need not be read again.
+    """
+    size = os.stat(file_path).st_size
+    if size == 0 or (max_size is not None and size > max_size):
+        return False, None
+    with open(file_path, 'rb') as f:
+        if size < SMALL_FILE_BYTES:
+            content = f.read()
+            return b'transcribe_mcp' in content.lower(), content
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return SCREEN_RE.search(mm) is not None, None
+
+
+def iter_candidate_files(root_dir: Path) -> Iterator[str]:
+    """Yield paths of files under root_dir whose names match INCLUDE_PATTERNS.
+
+    This is the only place EXCLUDE_DIRS and INCLUDE_PATTERNS are applied.
+
+    Walks with os.scandir, whose entries carry the file type from the
+    directory listing, so no extra stat is needed per entry. Excluded
+    directories are never entered and symlinked directories are not
+    followed; symlinked files are yielded like regular ones. Paths are
+    plain strings to avoid building a Path for every entry.
+    """
+    stack = [(os.fspath(root_dir), '')]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # entries like 'tests/outputs' are matched by their path relative to the root
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.name not in EXCLUDE_NAMES and rel_path not in EXCLUDE_REL_PATHS:
+                        stack.append((entry.path, rel_path))
+                elif entry.name.endswith(INCLUDE_SUFFIXES) and entry.is_file():
+                    yield entry.path
+
+
+def scan_files_to_process(root_dir: Path,
+                          max_size: Optional[int] = None) -> List[Tuple[Path, Optional[bytes]]]:
+    """Find all files that need processing, with any content already read.
+
+    Each entry pairs a path with the bytes read while screening it, or None
+    for files that were memory-mapped instead. Files larger than max_size
+    bytes (e.g. generated coverage reports) are left alone when a limit is
+    given.
+    """
     files = []
 
-    for file_path in root_dir.rglob('*'):
-        if file_path.is_file() and should_process_file(file_path):
-            try:
-                # Check if file contains 'transcribe_mcp' (case-insensitive)
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-                if 'transcribe_mcp' in content.lower():
-                    files.append(file_path)
-            except Exception as e:
-                print(f"Warning: Could not read {file_path}: {e}")
-
-    return sorted(files)
-
-
-def process_file(file_path: Path, dry_run: bool = False) -> Tuple[int, List[str]]:
-    """Process a single file and return count of replacements made."""
+    for path in iter_candidate_files(root_dir):
+        try:
+            matched, content = screen_file(path, max_size)
+            if matched:
+                files.append((Path(path), content))
+        except Exception as e:
+            print(f"Warning: Could not read {path}: {e}")
+
+    return sorted(files, key=lambda item: item[0])
+
+
+def prefetch_files(paths: List[Path]) -> None:
+    """Ask the kernel to start reading the given files into the page cache.
+
+    Uses posix_fadvise(POSIX_FADV_WILLNEED), which returns immediately, so
+    the reads overlap with processing of earlier files. A no-op where the
+    call is unavailable (e.g. Windows and macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def replace_contents(file_path: Path, content: bytes) -> None:
+    """Swap new content into file_path atomically, keeping its metadata.
+
+    Symlinks are resolved first, so a linked file is rewritten in place of
+    its target and the link itself survives. The content goes to a
+    uniquely named temporary file next to the target, which takes over the
+    target's mode (and owner and group when running as root) and is
+    removed again if anything fails before the rename. A file with other
+    hard links is written in place instead, since a rename would detach it
+    from them.
+    """
+    target = os.path.realpath(file_path)
+    st = os.stat(target)
+    if st.st_nlink > 1:
+        with open(target, 'r+b') as f:
+            f.write(content)
+            f.truncate()
+        return
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target),
+                                    prefix=f".{os.path.basename(target)}.", suffix='.tmp')
     try:
-        content = file_path.read_text(encoding='utf-8')
-        original_content = content
-        changes = []
-        total_replacements = 0
-
-        for old, new in REPLACEMENTS:
-            if old in content:
-                count = content.count(old)
-                content = content.replace(old, new)
-                total_replacements += count
-                changes.append(f"  {old} → {new}: {count} occurrence(s)")
-
-        if content != original_content:
-            if not dry_run:
-                file_path.write_text(content, encoding='utf-8')
-            return total_replacements, changes
-
-        return 0, []
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        shutil.copymode(target, tmp_path)
+        if hasattr(os, 'geteuid') and os.geteuid() == 0:
+            os.chown(tmp_path, st.st_uid, st.st_gid)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def process_file(file_path: Path, dry_run: bool = False,
+                 original: Optional[bytes] = None) -> Tuple[int, List[str]]:
+    """Process a single file and return count of replacements made.
+
+    original is the file's current content when the caller already has it.
+    """
+    try:
+        if original is None:
+            original = file_path.read_bytes()
+        # On small files plain substring checks rule out a match faster than
+        # running the regex; large files go straight to the single sub pass
+        if len(original) < QUICK_CHECK_BYTES and not any(old in original for old in MAPPING_B):
+            return 0, []
+        counts = Counter()
+
+        def substitute(match):
+            old = match.group(0)
+            counts[old] += 1
+            return MAPPING_B[old]
+
+        # One scan of the file applies every replacement and counts them;
+        # the per-key Counter is only needed for the change report
+        content, total_replacements = PATTERN_B.subn(substitute, original)
+        if not total_replacements or content == original:
+            return 0, []
+
+        changes = [f"  {old} → {new}: {counts[key]} occurrence(s)"
+                   for key, old, new in REPORT_KEYS if counts[key]]
+
+        if not dry_run:
+            replace_contents(file_path, content)
+        return total_replacements, changes
 
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
@@ -128,8 +277,14 @@ def main():
     parser = argparse.ArgumentParser(description='Rename project from transcribe_mcp to transcribe_mcp')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be changed without making changes')
     parser.add_argument('--verbose', action='store_true', help='Show detailed output')
+    parser.add_argument('--max-size', type=float, metavar='MIB',
+                        help='Skip files larger than this many MiB (default: no limit)')
     args = parser.parse_args()
 
+    # Write to stdout in blocks rather than flushing on every line
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     root_dir = Path(__file__).parent.parent.parent
 
     print("=" * 70)
@@ -143,7 +298,9 @@ def main():
 
     # Find files
     print("📂 Finding files to process...")
-    files = find_files_to_process(root_dir)
+    max_size = int(args.max_size * 1024 * 1024) if args.max_size is not None else None
+    scanned = scan_files_to_process(root_dir, max_size)
+    files = [file_path for file_path, _ in scanned]
     print(f"   Found {len(files)} files containing 'transcribe_mcp'")
     print()
 
@@ -152,20 +309,44 @@ def main():
     total_changes = 0
     files_changed = 0
 
-    for file_path in files:
+    # Files that will be read again (all of them in the pool, the mmapped
+    # ones otherwise) are prefetched while earlier ones are being processed
+    use_pool = len(files) > POOL_MIN_FILES
+    prefetch_files([file_path for file_path, content in scanned
+                    if use_pool or content is None])
+
+    if use_pool:
+        # Files are independent, so spread them over all cores; workers get
+        # paths only, since pickling the scanned content would cost more
+        # than re-reading it, and results come back in order
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(partial(process_file, dry_run=args.dry_run),
+                                        files, chunksize=32))
+    else:
+        # Few files: process in-process and reuse the bytes read while scanning
+        results = [process_file(file_path, args.dry_run, content)
+                   for file_path, content in scanned]
+
+    # Collect the per-file lines and write them in one go (in batches when
+    # verbose, where the report can grow large)
+    report = []
+    for file_path, (replacements, changes) in zip(files, results):
         rel_path = file_path.relative_to(root_dir)
-        replacements, changes = process_file(file_path, dry_run=args.dry_run)
 
         if replacements > 0:
             files_changed += 1
             total_changes += replacements
 
             if args.verbose or args.dry_run:
-                print(f"\n📝 {rel_path}")
-                for change in changes:
-                    print(change)
+                report.append(f"\n📝 {rel_path}\n")
+                report.extend(f"{change}\n" for change in changes)
             else:
-                print(f"   ✓ {rel_path} ({replacements} replacements)")
+                report.append(f"   ✓ {rel_path} ({replacements} replacements)\n")
+
+            if args.verbose and len(report) >= PRINT_BATCH_LINES:
+                sys.stdout.write("".join(report))
+                report.clear()
+    sys.stdout.write("".join(report))
 
     print()
     print("=" * 70)
@@ -39,7 +39,7 @@ def create_new_structure():
 
     for directory in directories:
         Path(directory).mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created: {directory}/")
+    sys.stdout.write("".join(f"✅ Created: {directory}/\n" for directory in directories))
 
 def safe_move(source: str, destination: str, description: str = "") -> bool:
     """Safely move files/directories with error handling."""
@@ -59,17 +59,27 @@ def safe_move(source: str, destination: str, description: str = "") -> bool:
         else:
             # For directories, merge if destination exists
             if dest_path.exists():
-                # Move contents
-                for item in source_path.iterdir():
-                    item_dest = dest_path / item.name
-                    if item.is_file():
-                        shutil.move(str(item), str(item_dest))
-                    else:
-                        shutil.move(str(item), str(item_dest))
-                # Remove empty source directory
-                source_path.rmdir()
+                # Move contents; on the same filesystem a plain rename is
+                # enough, so skip shutil.move's extra stats and copy fallback
+                same_device = source_path.stat().st_dev == dest_path.stat().st_dev
+                with os.scandir(source_path) as entries:
+                    for entry in entries:
+                        item_dest = os.path.join(dest_path, entry.name)
+                        if same_device:
+                            try:
+                                os.rename(entry.path, item_dest)
+                                continue
+                            except OSError:
+                                pass  # e.g. a non-empty directory already at item_dest
+                        shutil.move(entry.path, item_dest)
+                # Remove the now empty source directory and any parents it emptied
+                os.removedirs(source_path)
             else:
-                shutil.move(str(source_path), str(dest_path))
+                try:
+                    # Renames in place and prunes source parents left empty
+                    os.renames(source_path, dest_path)
+                except OSError:
+                    shutil.move(str(source_path), str(dest_path))
 
         print(f"✅ Moved: {source} → {destination} {description}")
         return True
@@ -300,6 +310,11 @@ def print_summary():
 
 def main():
     """Main reorganization process."""
+    # Write to stdout in blocks rather than flushing on every line;
+    # input() still flushes before each prompt
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("🚀 TranscribeMCP Folder Reorganization Script")
     print("=" * 50)
 
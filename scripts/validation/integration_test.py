@@ -8,6 +8,7 @@ including MCP tools, services, and WhisperX integration.
 import asyncio
 import sys
 import json
+import time
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -22,6 +23,9 @@ class TranscribeMCPIntegrationTest:
 
     def __init__(self):
         """Initialize the integration test."""
+        # Wall-clock time is stamped only at the start and end of the suite;
+        # per-test durations come from the monotonic clock
+        self._t0 = time.monotonic_ns()
         self.test_results = {
             "started_at": datetime.now().isoformat(),
             "tests_run": 0,
@@ -35,59 +39,81 @@ class TranscribeMCPIntegrationTest:
         logger.info("🚀 Starting TranscribeMCP Integration Test Suite")
         logger.info("=" * 60)
 
-        test_methods = [
-            ("Service Import Test", self.test_service_imports),
-            ("MCP Tools Test", self.test_mcp_tools),
-            ("Audio File Validation Test", self.test_audio_validation),
-            ("Mock Transcription Test", self.test_mock_transcription),
-            ("WhisperX Transcription Test", self.test_whisperx_transcription),
-            ("Progress Tracking Test", self.test_progress_tracking),
-            ("History Management Test", self.test_history_management),
-            ("Batch Processing Test", self.test_batch_processing),
-            ("Error Handling Test", self.test_error_handling),
-            ("Performance Test", self.test_performance)
+        # Stages run in order, keeping the original test order; tests within
+        # a stage only read state and run concurrently. Mutating tests (which
+        # flip WHISPERX_AVAILABLE or create jobs) and the timed Performance
+        # Test each get a stage of their own.
+        test_stages = [
+            [
+                ("Service Import Test", self.test_service_imports),
+                ("MCP Tools Test", self.test_mcp_tools),
+                ("Audio File Validation Test", self.test_audio_validation),
+            ],
+            [("Mock Transcription Test", self.test_mock_transcription)],
+            [("WhisperX Transcription Test", self.test_whisperx_transcription)],
+            [
+                ("Progress Tracking Test", self.test_progress_tracking),
+                ("History Management Test", self.test_history_management),
+            ],
+            [("Batch Processing Test", self.test_batch_processing)],
+            [("Error Handling Test", self.test_error_handling)],
+            [("Performance Test", self.test_performance)]
         ]
 
-        for test_name, test_method in test_methods:
-            await self.run_single_test(test_name, test_method)
+        for stage in test_stages:
+            # gather returns results in declaration order, not completion order
+            details = await asyncio.gather(
+                *(self.run_single_test(test_name, test_method)
+                  for test_name, test_method in stage)
+            )
+            for detail in details:
+                self.record_result(detail)
 
         self.print_final_results()
 
-    async def run_single_test(self, test_name: str, test_method):
-        """Run a single test and record results."""
+    async def run_single_test(self, test_name: str, test_method) -> Dict[str, Any]:
+        """Run a single test and return its detail record."""
         logger.info(f"🔍 Running: {test_name}")
 
+        t0 = time.monotonic_ns()
         try:
             result = await test_method()
-            self.test_results["tests_run"] += 1
+            elapsed_ms = (time.monotonic_ns() - t0) // 1_000_000
 
             if result.get("success", False):
-                self.test_results["tests_passed"] += 1
                 logger.info(f"✅ {test_name}: PASSED")
             else:
-                self.test_results["tests_failed"] += 1
                 logger.error(f"❌ {test_name}: FAILED - {result.get('error', 'Unknown error')}")
 
-            self.test_results["test_details"].append({
+            detail = {
                 "name": test_name,
                 "success": result.get("success", False),
                 "result": result,
-                "timestamp": datetime.now().isoformat()
-            })
+                "elapsed_ms": elapsed_ms
+            }
 
         except Exception as e:
-            self.test_results["tests_run"] += 1
-            self.test_results["tests_failed"] += 1
+            elapsed_ms = (time.monotonic_ns() - t0) // 1_000_000
             logger.error(f"❌ {test_name}: FAILED - Exception: {str(e)}")
 
-            self.test_results["test_details"].append({
+            detail = {
                 "name": test_name,
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            })
+                "elapsed_ms": elapsed_ms
+            }
 
         logger.info("")  # Add spacing between tests
+        return detail
+
+    def record_result(self, detail: Dict[str, Any]):
+        """Add a test's detail record to the suite results."""
+        self.test_results["tests_run"] += 1
+        if detail["success"]:
+            self.test_results["tests_passed"] += 1
+        else:
+            self.test_results["tests_failed"] += 1
+        self.test_results["test_details"].append(detail)
 
     async def test_service_imports(self) -> Dict[str, Any]:
         """Test that all services can be imported and instantiated."""
@@ -398,7 +424,6 @@ class TranscribeMCPIntegrationTest:
     async def test_performance(self) -> Dict[str, Any]:
         """Test basic performance metrics."""
         try:
-            import time
             from src.services.audio_file_service import AudioFileService
 
             service = AudioFileService()
@@ -426,6 +451,7 @@ class TranscribeMCPIntegrationTest:
     def print_final_results(self):
         """Print final test results summary."""
         self.test_results["completed_at"] = datetime.now().isoformat()
+        self.test_results["elapsed_ms"] = (time.monotonic_ns() - self._t0) // 1_000_000
 
         logger.info("🏁 Integration Test Results")
         logger.info("=" * 60)
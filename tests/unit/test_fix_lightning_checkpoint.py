@@ -0,0 +1,229 @@
+"""
+Unit tests for the Lightning checkpoint fix script.
+"""
+
+import importlib.util
+import os
+import pickle
+import shutil
+import zipfile
+import zlib
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "utils" / "fix_lightning_checkpoint.py"
+
+
+@pytest.fixture(scope="module")
+def fix():
+    """Load the script as a module."""
+    spec = importlib.util.spec_from_file_location("fix_lightning_checkpoint", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def checkpoint(tmp_path, fix, monkeypatch):
+    """Write a small Lightning 1.5.4 checkpoint and point the script at it."""
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    path = assets / "pytorch_model.bin"
+    state_dict = {
+        "layer.weight": torch.arange(12, dtype=torch.float32).reshape(3, 4),
+        "layer.bias": torch.ones(3),
+        "steps": torch.tensor(7),
+    }
+    torch.save({"pytorch-lightning_version": "1.5.4", "state_dict": state_dict}, path)
+
+    monkeypatch.setattr(fix, "WHISPERX_ASSETS", assets)
+    monkeypatch.setattr(fix, "CHECKPOINT_PATH", path)
+    monkeypatch.delenv("TRANSCRIBEMS_CHECKPOINT_BACKUP", raising=False)
+    return path, state_dict
+
+
+def assert_reloads(path, state_dict, version):
+    """The fixed file must load with mmap=True and keep every tensor."""
+    loaded = torch.load(path, map_location="cpu", weights_only=True, mmap=True)
+    assert loaded["pytorch-lightning_version"] == version
+    assert loaded["state_dict"].keys() == state_dict.keys()
+    for key, value in state_dict.items():
+        assert torch.equal(loaded["state_dict"][key], value)
+
+
+def test_same_length_version_round_trips(checkpoint, fix, monkeypatch):
+    """A same-length version bump is a byte patch and keeps mmap loading."""
+    path, state_dict = checkpoint
+
+    def fail_save(*args, **kwargs):
+        raise AssertionError("torch.save should not be needed")
+
+    monkeypatch.setattr(fix.torch, "save", fail_save)
+
+    assert fix.fix_lightning_checkpoint() is not None
+    assert_reloads(path, state_dict, "2.5.5")
+
+
+def test_length_change_falls_back_to_torch_save(checkpoint, fix, monkeypatch):
+    """A longer version string is written by torch.save, keeping mmap loading."""
+    path, state_dict = checkpoint
+    monkeypatch.setattr(fix, "TARGET_LIGHTNING_VERSION", "2.10.0")
+
+    assert fix._patch_version_in_zip(path, "2.10.0") is None
+    assert fix.fix_lightning_checkpoint() is not None
+    assert_reloads(path, state_dict, "2.10.0")
+
+
+def test_patch_without_reflink_is_in_place(checkpoint, fix, monkeypatch):
+    """Without reflink support the original file is patched, not copied."""
+    path, state_dict = checkpoint
+    monkeypatch.setattr(fix, "_try_reflink", lambda src, dst: False)
+    inode = os.stat(path).st_ino
+
+    assert fix._patch_version_in_zip(path, "2.5.5") == "1.5.4"
+    assert os.stat(path).st_ino == inode
+    assert_reloads(path, state_dict, "2.5.5")
+
+
+def test_patch_with_reflink_replaces_a_clone(checkpoint, fix, monkeypatch):
+    """With reflink support the patched clone is renamed over the original."""
+    path, state_dict = checkpoint
+
+    def clone(src, dst):
+        shutil.copyfile(src, dst)
+        return True
+
+    monkeypatch.setattr(fix, "_try_reflink", clone)
+    inode = os.stat(path).st_ino
+
+    assert fix._patch_version_in_zip(path, "2.5.5") == "1.5.4"
+    assert os.stat(path).st_ino != inode
+    assert not path.with_name(path.name + ".tmp").exists()
+    assert_reloads(path, state_dict, "2.5.5")
+
+
+def test_version_tuple_orders_numerically(fix):
+    """Versions compare by number, not as strings."""
+    assert fix._version_tuple("2.10.0") > fix._version_tuple("2.5.5")
+    assert fix._version_tuple("1.5.4rc1") == (1, 5, 4)
+    assert fix._version_tuple("2") == (2,)
+
+
+@pytest.mark.parametrize("protocol", [2, 4])
+def test_find_string_value_locates_the_value_opcode(fix, protocol):
+    """The returned span covers exactly the pickled value string."""
+    pkl = pickle.dumps({"other": "x", fix.LIGHTNING_VERSION_KEY: "1.5.4"}, protocol=protocol)
+    opcode_name, start, end, value = fix._find_string_value(pkl, fix.LIGHTNING_VERSION_KEY)
+
+    assert value == "1.5.4"
+    assert pkl[start:end] == fix._encode_pickle_str(opcode_name, "1.5.4")
+
+
+def test_find_string_value_ignores_missing_or_non_string_values(fix):
+    """Only a string value stored under the key is reported."""
+    assert fix._find_string_value(pickle.dumps({"a": "b"}, protocol=2), "key") is None
+    assert fix._find_string_value(pickle.dumps({"key": 3}, protocol=2), "key") is None
+
+
+def write_zip(path, payload, compression=zipfile.ZIP_STORED):
+    """Write a zip with a payload member between two other members."""
+    with zipfile.ZipFile(path, "w", compression=compression) as zf:
+        zf.writestr("archive/first", b"a" * 100)
+        zf.writestr("archive/data.pkl", payload)
+        zf.writestr("archive/last", b"z" * 100)
+
+
+def patch_member(fix, path, old, new):
+    """Patch old -> new inside archive/data.pkl and return the result."""
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo("archive/data.pkl")
+        payload = zf.read(info)
+    offset = payload.index(old)
+    patched = payload[:offset] + new + payload[offset + len(old):]
+    return fix._patch_member_in_place(path, info, offset, new, patched), patched
+
+
+def test_patch_member_in_place_fixes_header_and_central_crcs(tmp_path, fix):
+    """A patched stored member passes zipfile's CRC check."""
+    path = tmp_path / "plain.zip"
+    write_zip(path, b"version=1.5.4;")
+
+    ok, patched = patch_member(fix, path, b"1.5.4", b"2.5.5")
+
+    assert ok
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+        assert zf.read("archive/data.pkl") == patched
+        assert zf.getinfo("archive/data.pkl").CRC == zlib.crc32(patched)
+        assert zf.read("archive/last") == b"z" * 100
+
+
+def test_patch_member_in_place_handles_data_descriptors(tmp_path, fix):
+    """Members written with a data descriptor (as torch does) are patched."""
+    path = tmp_path / "descriptor.pt"
+    torch.save({fix.LIGHTNING_VERSION_KEY: "1.5.4", "w": torch.ones(2)}, path)
+    with zipfile.ZipFile(path) as zf:
+        info = fix._find_data_pkl(zf)
+        payload = zf.read(info)
+    assert info.flag_bits & 0x08
+
+    found = fix._find_string_value(payload, fix.LIGHTNING_VERSION_KEY)
+    opcode_name, start, end, _ = found
+    replacement = fix._encode_pickle_str(opcode_name, "2.5.5")
+    patched = payload[:start] + replacement + payload[end:]
+
+    assert fix._patch_member_in_place(path, info, start, replacement, patched)
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+    assert torch.load(path, weights_only=True, mmap=True)[fix.LIGHTNING_VERSION_KEY] == "2.5.5"
+
+
+def test_patch_member_in_place_rejects_compressed_members(tmp_path, fix):
+    """Deflated members cannot be patched byte for byte."""
+    path = tmp_path / "deflated.zip"
+    write_zip(path, b"version=1.5.4;" * 20, compression=zipfile.ZIP_DEFLATED)
+    before = path.read_bytes()
+
+    ok, _ = patch_member(fix, path, b"1.5.4", b"2.5.5")
+
+    assert not ok
+    assert path.read_bytes() == before
+
+
+def test_patch_member_in_place_refuses_on_crc_mismatch(tmp_path, fix):
+    """Nothing is written when the recorded CRC does not match the member."""
+    path = tmp_path / "plain.zip"
+    write_zip(path, b"version=1.5.4;")
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo("archive/data.pkl")
+    info.CRC ^= 1
+    before = path.read_bytes()
+
+    assert not fix._patch_member_in_place(path, info, 8, b"2.5.5", b"version=2.5.5;")
+    assert path.read_bytes() == before
+
+
+def test_validate_state_dict_reports_non_finite_float_tensors(fix):
+    """Only floating point tensors with inf or NaN are reported."""
+    state_dict = {
+        "finite": torch.zeros(4),
+        "mask": torch.tensor([0.0, float("-inf")]),
+        "stats": torch.tensor([float("nan")]),
+        "steps": torch.tensor([3]),
+    }
+
+    assert sorted(fix.validate_state_dict({"state_dict": state_dict})) == ["mask", "stats"]
+    assert fix.validate_state_dict({"finite": torch.ones(2)}) == []
+
+
+def test_non_finite_buffers_pass_unless_check_finite(checkpoint, fix):
+    """Loading is the pass criterion; the finite scan is opt-in."""
+    path, state_dict = checkpoint
+    state_dict = dict(state_dict, mask=torch.tensor([0.0, float("-inf")]))
+    torch.save({"pytorch-lightning_version": "2.5.5", "state_dict": state_dict}, path)
+
+    assert fix.test_checkpoint_loading(full_validate=True)
+    assert not fix.test_checkpoint_loading(full_validate=True, check_finite=True)
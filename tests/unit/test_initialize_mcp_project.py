@@ -0,0 +1,93 @@
+"""
+Unit tests for the MCP project scaffolding script.
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "setup" / "initialize_mcp_project.py"
+
+
+@pytest.fixture(scope="module")
+def scaffold():
+    """Load the script as a module."""
+    spec = importlib.util.spec_from_file_location("initialize_mcp_project", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_leaf_directories_drops_parents_only(scaffold):
+    """A directory is a leaf unless another entry lies inside it."""
+    directories = ["a", "a/b", "a/b/c", "a/bc", "d", "a/b"]
+
+    assert scaffold._leaf_directories(directories) == ["a/b/c", "a/bc", "d"]
+
+
+def test_leaf_directories_do_not_treat_name_prefixes_as_parents(scaffold):
+    """'docs' is not the parent of 'docs-old'."""
+    assert scaffold._leaf_directories(["docs", "docs-old", "docs/api"]) == ["docs/api", "docs-old"]
+
+
+def test_with_parents_adds_every_ancestor(scaffold):
+    """Each directory brings all of its parents along."""
+    assert scaffold._with_parents(["a/b/c", "d"]) == {"a", "a/b", "a/b/c", "d"}
+    assert scaffold._with_parents([]) == set()
+
+
+def test_directory_constants_describe_the_same_tree(scaffold):
+    """Creating the leaves alone produces every listed directory."""
+    assert scaffold._with_parents(scaffold._DIRECTORY_LEAVES) == scaffold._DIRECTORY_TREE
+    assert set(scaffold.DIRECTORIES) <= scaffold._DIRECTORY_TREE
+
+
+def test_create_directory_structure_creates_all_directories(tmp_path, scaffold):
+    """Every directory and parent exists afterwards and is reported."""
+    created = scaffold.create_directory_structure("demo", tmp_path)
+
+    assert created == set(scaffold._DIRECTORY_TREE)
+    for directory in scaffold._DIRECTORY_TREE:
+        assert (tmp_path / directory).is_dir()
+
+
+def test_write_if_changed_writes_new_and_changed_files(tmp_path, scaffold):
+    """Missing files and same-size files with other content are written."""
+    path = os.fspath(tmp_path / "file.txt")
+
+    assert scaffold._write_if_changed(path, b"abc") is True
+    assert scaffold._write_if_changed(path, b"xyz") is True
+    assert Path(path).read_bytes() == b"xyz"
+
+
+def test_write_if_changed_leaves_identical_files_untouched(tmp_path, scaffold):
+    """Identical content is not rewritten, so the mtime is kept."""
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"abc")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    assert scaffold._write_if_changed(os.fspath(path), b"abc") is False
+    assert path.stat().st_mtime_ns == 1_000_000_000
+
+
+def test_create_template_files_restores_deleted_and_edited_files(tmp_path, scaffold):
+    """A re-run rewrites only the files that no longer match."""
+    created = scaffold.create_directory_structure("demo", tmp_path)
+    scaffold.create_template_files("demo", tmp_path, created)
+    readme = tmp_path / "README.md"
+    pyproject = tmp_path / "pyproject.toml"
+    expected_readme = readme.read_bytes()
+    expected_pyproject = pyproject.read_bytes()
+    untouched = tmp_path / "Makefile"
+    os.utime(untouched, ns=(1_000_000_000, 1_000_000_000))
+
+    readme.unlink()
+    pyproject.write_bytes(b"edited")
+    scaffold.create_template_files("demo", tmp_path, created)
+
+    assert readme.read_bytes() == expected_readme
+    assert pyproject.read_bytes() == expected_pyproject
+    assert untouched.stat().st_mtime_ns == 1_000_000_000
+    assert not (tmp_path / ".scaffold-hash").exists()
@@ -0,0 +1,181 @@
+"""
+Unit tests for the project rename script.
+"""
+
+import importlib.util
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "utils" / "rename_project.py"
+
+
+@pytest.fixture(scope="module")
+def rename():
+    """Load the script as a module."""
+    spec = importlib.util.spec_from_file_location("rename_project", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def old_to_new(rename, monkeypatch):
+    """Swap the (identity) project mappings for a real old -> new rename."""
+    mapping = {b"old_name": b"new_name", b"OldName": b"NewName"}
+    monkeypatch.setattr(rename, "MAPPING_B", mapping)
+    monkeypatch.setattr(rename, "PATTERN_B", re.compile(b"old_name|OldName"))
+    monkeypatch.setattr(rename, "REPORT_KEYS",
+                        [(old, old.decode(), new.decode()) for old, new in mapping.items()])
+
+
+def make_tree(root, paths):
+    """Create each file in paths (relative to root) with some content."""
+    for rel_path in paths:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("transcribe_mcp\n")
+
+
+def candidates(rename, root):
+    """Root-relative POSIX paths yielded by the walker."""
+    return sorted(Path(path).relative_to(root).as_posix()
+                  for path in rename.iter_candidate_files(root))
+
+
+def test_walker_applies_include_and_exclude_rules(tmp_path, rename):
+    """Only included suffixes outside excluded directories are yielded."""
+    make_tree(tmp_path, [
+        "a.py", "README.md", "image.png",
+        "src/b.toml", ".git/config.py", "src/__pycache__/c.py",
+        "node_modules/pkg/index.json",
+    ])
+
+    assert candidates(rename, tmp_path) == ["README.md", "a.py", "src/b.toml"]
+
+
+def test_walker_prunes_tests_outputs_by_root_relative_path(tmp_path, rename):
+    """'tests/outputs' is skipped only where it sits directly under the root."""
+    assert "tests/outputs" in rename.EXCLUDE_REL_PATHS
+    make_tree(tmp_path, ["tests/outputs/o.json", "tests/c.py", "x/tests/outputs/k.py"])
+
+    assert candidates(rename, tmp_path) == ["tests/c.py", "x/tests/outputs/k.py"]
+
+
+def test_walker_ignores_excluded_names_above_the_root(tmp_path, rename):
+    """A project that itself lives under e.g. venv/ is still scanned."""
+    root = tmp_path / "venv" / "tests" / "outputs" / "project"
+    make_tree(root, ["a.py", "venv/b.py"])
+
+    assert candidates(rename, root) == ["a.py"]
+
+
+def test_walker_yields_symlinked_files_but_skips_symlinked_dirs(tmp_path, rename):
+    """File links are followed; directory links are not descended into."""
+    make_tree(tmp_path, ["real/a.py"])
+    (tmp_path / "link.py").symlink_to(tmp_path / "real" / "a.py")
+    (tmp_path / "linkdir").symlink_to(tmp_path / "real", target_is_directory=True)
+
+    assert candidates(rename, tmp_path) == ["link.py", "real/a.py"]
+
+
+def test_process_file_replaces_and_counts(tmp_path, rename, old_to_new):
+    """Every key is replaced in one pass and counted per key."""
+    path = tmp_path / "a.py"
+    path.write_bytes(b"old_name = OldName(old_name)\n")
+
+    total, changes = rename.process_file(path)
+
+    assert total == 3
+    assert changes == ["  old_name → new_name: 2 occurrence(s)",
+                       "  OldName → NewName: 1 occurrence(s)"]
+    assert path.read_bytes() == b"new_name = NewName(new_name)\n"
+
+
+def test_process_file_dry_run_leaves_file_alone(tmp_path, rename, old_to_new):
+    """A dry run reports the replacements without writing."""
+    path = tmp_path / "a.py"
+    path.write_bytes(b"old_name\n")
+
+    assert rename.process_file(path, dry_run=True)[0] == 1
+    assert path.read_bytes() == b"old_name\n"
+
+
+def test_small_files_without_keys_skip_the_regex(tmp_path, rename, old_to_new, monkeypatch):
+    """Below QUICK_CHECK_BYTES the substring pre-check rules a file out."""
+    class NoRegex:
+        def subn(self, *args):
+            raise AssertionError("regex should not run")
+
+    monkeypatch.setattr(rename, "PATTERN_B", NoRegex())
+    path = tmp_path / "a.py"
+    path.write_bytes(b"nothing to see\n")
+
+    assert rename.process_file(path) == (0, [])
+
+
+def test_large_files_go_straight_to_the_regex(tmp_path, rename, old_to_new):
+    """At or above QUICK_CHECK_BYTES the single sub pass does the work."""
+    path = tmp_path / "big.md"
+    path.write_bytes(b"x" * rename.QUICK_CHECK_BYTES + b" old_name")
+
+    assert rename.process_file(path)[0] == 1
+    assert path.read_bytes().endswith(b" new_name")
+
+
+def test_replace_contents_keeps_mode_and_leaves_no_temp_file(tmp_path, rename):
+    """The swap keeps the file mode and cleans up after itself."""
+    path = tmp_path / "run.sh"
+    path.write_bytes(b"old")
+    path.chmod(0o755)
+
+    rename.replace_contents(path, b"new")
+
+    assert path.read_bytes() == b"new"
+    assert path.stat().st_mode & 0o777 == 0o755
+    assert os.listdir(tmp_path) == ["run.sh"]
+
+
+def test_replace_contents_rewrites_symlink_targets(tmp_path, rename):
+    """A symlinked file is rewritten through the link, which survives."""
+    target = tmp_path / "target.py"
+    target.write_bytes(b"old")
+    link = tmp_path / "link.py"
+    link.symlink_to(target)
+
+    rename.replace_contents(link, b"new")
+
+    assert link.is_symlink()
+    assert target.read_bytes() == b"new"
+
+
+def test_replace_contents_keeps_hard_links(tmp_path, rename):
+    """A hard-linked file is written in place so every name sees the change."""
+    path = tmp_path / "a.py"
+    path.write_bytes(b"old content")
+    other = tmp_path / "b.py"
+    os.link(path, other)
+    inode = path.stat().st_ino
+
+    rename.replace_contents(path, b"new")
+
+    assert path.stat().st_ino == inode
+    assert other.read_bytes() == b"new"
+
+
+def test_replace_contents_removes_temp_file_on_failure(tmp_path, rename, monkeypatch):
+    """A failure before the rename leaves the original and no temp file."""
+    path = tmp_path / "a.py"
+    path.write_bytes(b"old")
+
+    def fail(*args):
+        raise OSError("copymode failed")
+
+    monkeypatch.setattr(rename.shutil, "copymode", fail)
+
+    with pytest.raises(OSError):
+        rename.replace_contents(path, b"new")
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["a.py"]